@@ -101,7 +101,7 @@ impl Agreement for Agent {
         value: Value,
         agreement_fieldname: &String,
     ) -> Result<(String, Vec<String>), Box<dyn Error>> {
-        let mut new_obj: Value = value.clone();
+        let mut new_obj: Value = value;
         new_obj.as_object_mut().map(|obj| {
             obj.remove(DOCUMENT_AGREEMENT_HASH_FIELDNAME);
             obj.remove(JACS_PREVIOUS_VERSION_FIELDNAME);
@@ -149,8 +149,8 @@ impl Agreement for Agent {
             "question": question_string,
             "context": context_string
         });
-        let updated_document =
-            self.update_document(document_key, &serde_json::to_string(&value)?, None, None)?;
+        let original_document_hash = value[SHA256_FIELDNAME].clone();
+        let updated_document = self.update_document_value(document_key, value, None, None)?;
 
         let agreement_hash_value_after =
             json!(self.agreement_hash(updated_document.value.clone(), &agreement_fieldname_key)?);
@@ -163,7 +163,7 @@ impl Agreement for Agent {
             .into());
         }
 
-        if value[SHA256_FIELDNAME] == updated_document.value[SHA256_FIELDNAME] {
+        if original_document_hash == updated_document.value[SHA256_FIELDNAME] {
             return Err(format!("document hashes should have changed {}", document_key).into());
         };
 
@@ -206,8 +206,7 @@ impl Agreement for Agent {
             return Err("no agreement   present".into());
         }
 
-        let updated_document =
-            self.update_document(document_key, &serde_json::to_string(&value)?, None, None)?;
+        let updated_document = self.update_document_value(document_key, value, None, None)?;
 
         Ok(updated_document)
     }
@@ -250,8 +249,7 @@ impl Agreement for Agent {
             });
         }
 
-        let updated_document =
-            self.update_document(document_key, &serde_json::to_string(&value)?, None, None)?;
+        let updated_document = self.update_document_value(document_key, value, None, None)?;
 
         Ok(updated_document)
     }
@@ -315,12 +313,9 @@ impl Agreement for Agent {
             });
         }
         // add to doc
-        let updated_document = self.update_document(
-            &agent_complete_key,
-            &serde_json::to_string(&value)?,
-            None,
-            None,
-        )?;
+        let original_document_hash = value[SHA256_FIELDNAME].clone();
+        let updated_document =
+            self.update_document_value(&agent_complete_key, value, None, None)?;
 
         let agreement_hash_value_after =
             self.agreement_hash(updated_document.value.clone(), &agreement_fieldname_key)?;
@@ -334,7 +329,7 @@ impl Agreement for Agent {
             .into());
         }
 
-        if value[SHA256_FIELDNAME] == updated_document.value[SHA256_FIELDNAME] {
+        if original_document_hash == updated_document.value[SHA256_FIELDNAME] {
             return Err(format!("document hashes should have changed {}", document_key).into());
         };
 
@@ -389,7 +384,6 @@ impl Agreement for Agent {
         };
 
         let document = self.get_document(document_key)?;
-        let local_doc_value = document.value.clone();
         let error_message = format!("{} missing", DOCUMENT_AGREEMENT_HASH_FIELDNAME);
         let original_agreement_hash_value = document.value[DOCUMENT_AGREEMENT_HASH_FIELDNAME]
             .as_str()
@@ -413,6 +407,11 @@ impl Agreement for Agent {
         if let Some(jacs_agreement) = document.value.get(agreement_fieldname_key.clone()) {
             if let Some(signatures) = jacs_agreement.get("signatures") {
                 if let Some(signatures_array) = signatures.as_array() {
+                    // the signed fields are the same for every signer, so trim the document once
+                    let (_values_as_string, fields) = self.trim_fields_for_hashing_and_signing(
+                        document.value.clone(),
+                        &agreement_fieldname_key,
+                    )?;
                     for signature in signatures_array {
                         // todo validate each signature
                         let agent_id_and_version = format!(
@@ -442,7 +441,7 @@ impl Agreement for Agent {
                             .expect("REASON public_key_enc_type")
                             .to_string();
                         let agents_public_key = self.fs_load_public_key(&noted_hash)?;
-                        let new_hash = hash_public_key(agents_public_key.clone());
+                        let new_hash = hash_public_key(&agents_public_key);
                         if new_hash != noted_hash {
                             return Err(format!(
                                 "wrong public key for {} , {}",
@@ -454,11 +453,6 @@ impl Agreement for Agent {
                             "testing agreement sig agent_id_and_version {} {} {} ",
                             agent_id_and_version, noted_hash, public_key_enc_type
                         );
-                        let (_values_as_string, fields) = self
-                            .trim_fields_for_hashing_and_signing(
-                                local_doc_value.clone(),
-                                &agreement_fieldname_key,
-                            )?;
                         let result = self.signature_verification_procedure(
                             &document.value,
                             Some(&fields),
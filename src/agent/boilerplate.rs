@@ -4,6 +4,7 @@ use std::error::Error;
 pub trait BoilerPlate {
     fn get_id(&self) -> Result<String, Box<dyn Error>>;
     fn get_public_key(&self) -> Result<Vec<u8>, Box<dyn Error>>;
+    fn get_public_key_hash(&self) -> Result<String, Box<dyn Error>>;
     fn get_version(&self) -> Result<String, Box<dyn Error>>;
     fn as_string(&self) -> Result<String, Box<dyn Error>>;
     fn get_lookup_id(&self) -> Result<String, Box<dyn Error>>;
@@ -24,6 +25,13 @@ impl BoilerPlate for Agent {
         }
     }
 
+    fn get_public_key_hash(&self) -> Result<String, Box<dyn Error>> {
+        match &self.public_key_hash {
+            Some(public_key_hash) => Ok(public_key_hash.to_string()),
+            None => Err("public_key_hash is None".into()),
+        }
+    }
+
     fn get_version(&self) -> Result<String, Box<dyn Error>> {
         match &self.version {
             Some(version) => Ok(version.to_string()),
@@ -8,13 +8,16 @@ use crate::agent::DOCUMENT_AGENT_SIGNATURE_FIELDNAME;
 use crate::agent::SHA256_FIELDNAME;
 use crate::crypt::hash::hash_string;
 use crate::schema::utils::ValueExt;
+use crate::schema::Schema;
 use chrono::Local;
 use chrono::Utc;
 use difference::{Changeset, Difference};
 use flate2::read::GzDecoder;
 use log::error;
 use regex::Regex;
+use serde::{Serialize, Serializer};
 use serde_json::json;
+use serde_json::Map;
 use serde_json::Value;
 use sha2::{Digest, Sha256};
 use std::error::Error;
@@ -23,8 +26,12 @@ use std::fs::{self, File};
 use std::io::Read;
 use std::io::Write;
 use std::path::Path;
+use std::sync::OnceLock;
 use uuid::Uuid;
 
+/// pulls the short name out of a schema url, compiled on first use
+static SHORT_SCHEMA_REGEX: OnceLock<Regex> = OnceLock::new();
+
 #[derive(Clone, Debug)]
 pub struct JACSDocument {
     pub id: String,
@@ -56,7 +63,7 @@ impl JACSDocument {
 
     pub fn getshortschema(&self) -> Result<String, Box<dyn Error>> {
         let longschema = self.getschema()?;
-        let re = Regex::new(r"/([^/]+)\.schema\.json$").unwrap();
+        let re = SHORT_SCHEMA_REGEX.get_or_init(|| Regex::new(r"/([^/]+)\.schema\.json$").unwrap());
 
         if let Some(caps) = re.captures(&longschema) {
             if let Some(matched) = caps.get(1) {
@@ -142,6 +149,18 @@ impl fmt::Display for JACSDocument {
     }
 }
 
+/// serializes an object without one of its fields, keeping the object's own key order
+struct WithoutField<'a> {
+    object: &'a Map<String, Value>,
+    field: &'a str,
+}
+
+impl Serialize for WithoutField<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.collect_map(self.object.iter().filter(|(key, _)| *key != self.field))
+    }
+}
+
 pub trait Document {
     fn verify_document_signature(
         &mut self,
@@ -191,6 +210,15 @@ pub trait Document {
         attachments: Option<Vec<String>>,
         embed: Option<bool>,
     ) -> Result<JACSDocument, Box<dyn Error>>;
+    /// same as update_document, but takes the modified document as a Value
+    /// so callers that already hold one skip serializing and re-parsing it
+    fn update_document_value(
+        &mut self,
+        document_key: &String,
+        new_document: Value,
+        attachments: Option<Vec<String>>,
+        embed: Option<bool>,
+    ) -> Result<JACSDocument, Box<dyn Error>>;
     fn create_file_json(
         &mut self,
         filepath: &String,
@@ -246,25 +274,17 @@ impl Document for Agent {
         let sha256_hash = format!("{:x}", hasher.finalize());
 
         // Create the JSON object
-        let file_json = json!({
+        let mut file_json = json!({
             "mimetype": mime_type,
             "path": filepath,
             "embed": embed,
             "sha256": sha256_hash
         });
 
-        // Add the contents field if embed is true
-        let file_json = if embed {
-            file_json
-                .as_object()
-                .unwrap()
-                .clone()
-                .into_iter()
-                .chain(vec![("contents".to_string(), json!(base64_contents))])
-                .collect()
-        } else {
-            file_json
-        };
+        // Add the contents field if embed is true, in place rather than rebuilding the object
+        if embed {
+            file_json["contents"] = json!(base64_contents);
+        }
 
         Ok(file_json)
     }
@@ -313,14 +333,12 @@ impl Document for Agent {
         let mut instance = self.schema.create(json)?;
 
         if let Some(attachment_list) = attachments {
-            let mut files_array: Vec<Value> = Vec::new();
+            let final_embed = embed.unwrap_or(false);
+            let mut files_array: Vec<Value> = Vec::with_capacity(attachment_list.len());
 
             // Iterate over each attachment
             for attachment_path in attachment_list {
-                let final_embed = embed.unwrap_or(false);
-                let file_json = self
-                    .create_file_json(&attachment_path, final_embed)
-                    .unwrap();
+                let file_json = self.create_file_json(&attachment_path, final_embed)?;
 
                 // Add the file JSON to the files array
                 files_array.push(file_json);
@@ -356,11 +374,13 @@ impl Document for Agent {
     }
 
     fn hash_doc(&self, doc: &Value) -> Result<String, Box<dyn Error>> {
-        let mut doc_copy = doc.clone();
-        doc_copy
-            .as_object_mut()
-            .map(|obj| obj.remove(SHA256_FIELDNAME));
-        let doc_string = serde_json::to_string(&doc_copy)?;
+        let doc_string = match doc.as_object() {
+            Some(object) => serde_json::to_string(&WithoutField {
+                object,
+                field: SHA256_FIELDNAME,
+            })?,
+            None => serde_json::to_string(doc)?,
+        };
         Ok(hash_string(&doc_string))
     }
 
@@ -405,9 +425,20 @@ impl Document for Agent {
         new_document_string: &String,
         attachments: Option<Vec<String>>,
         embed: Option<bool>,
+    ) -> Result<JACSDocument, Box<dyn Error>> {
+        let new_document: Value = Schema::parse_json(new_document_string)?;
+        self.update_document_value(document_key, new_document, attachments, embed)
+    }
+
+    fn update_document_value(
+        &mut self,
+        document_key: &String,
+        new_document: Value,
+        attachments: Option<Vec<String>>,
+        embed: Option<bool>,
     ) -> Result<JACSDocument, Box<dyn Error>> {
         // check that old document is found
-        let mut new_document: Value = self.schema.validate_header(new_document_string)?;
+        let mut new_document: Value = self.schema.validate_header_value(new_document)?;
         let error_message = format!("original document {} not found", document_key);
         let original_document = self.get_document(document_key).expect(&error_message);
         let value = original_document.value;
@@ -424,13 +455,11 @@ impl Document for Agent {
             .verify_document_files(&new_document)
             .expect("file verification");
         if let Some(attachment_list) = attachments {
+            let final_embed = embed.unwrap_or(false);
+            files_array.reserve(attachment_list.len());
             // Iterate over each attachment
             for attachment_path in attachment_list {
-                // Call create_file_json with embed set to false
-                let final_embed = embed.unwrap_or(false);
-                let file_json = self
-                    .create_file_json(&attachment_path, final_embed)
-                    .unwrap();
+                let file_json = self.create_file_json(&attachment_path, final_embed)?;
 
                 // Add the file JSON to the files array
                 files_array.push(file_json);
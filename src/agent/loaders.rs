@@ -9,15 +9,18 @@ use regex::Regex;
 use secrecy::ExposeSecret;
 
 use std::fs::File;
-use std::io::Read;
-use std::io::Write;
 
 use chrono::Utc;
 use log::{debug, error, info, warn};
 use std::env;
 use std::error::Error;
+use std::sync::OnceLock;
 use std::{fs, path::Path, path::PathBuf};
 
+/// filename patterns for fs_document_save, compiled on first use
+static EXTENSION_REGEX: OnceLock<Regex> = OnceLock::new();
+static SIGNED_EXTENSION_REGEX: OnceLock<Regex> = OnceLock::new();
+
 fn not_implemented_error() -> Box<dyn Error> {
     error!("NOT IMPLEMENTED");
     return "NOT IMPLEMENTED".into();
@@ -160,12 +163,15 @@ impl FileLoader for Agent {
 
     /// in JACS the public keys need to be added manually
     fn fs_load_public_key(&self, agent_id_and_version: &String) -> Result<Vec<u8>, Box<dyn Error>> {
-        let mut default_dir = env::var("JACS_KEY_DIRECTORY").expect("JACS_KEY_DIRECTORY");
-        default_dir = format!("{}/public_keys/", default_dir);
-        let public_key_filename = format!("{}.pem", agent_id_and_version);
-        // todo
-        let public_key_type_filename = format!("{}.enc_type", agent_id_and_version);
-        return Ok(load_key_file(&default_dir, &public_key_filename)?);
+        let public_key_path = public_key_path(agent_id_and_version);
+        // todo load the .enc_type file saved next to the key
+        let mut public_keys = self.public_keys.lock().expect("public_keys lock");
+        if let Some(public_key) = public_keys.get(&public_key_path) {
+            return Ok(public_key.clone());
+        }
+        let public_key = fs::read(&public_key_path)?;
+        public_keys.insert(public_key_path, public_key.clone());
+        return Ok(public_key);
     }
 
     /// in JACS the public keys need to be added manually
@@ -175,16 +181,16 @@ impl FileLoader for Agent {
         public_key: &[u8],
         public_key_enc_type: &[u8],
     ) -> Result<(), Box<dyn Error>> {
-        let mut default_dir = env::var("JACS_KEY_DIRECTORY").expect("JACS_KEY_DIRECTORY");
-        default_dir = format!("{}/public_keys/", default_dir);
-        let public_key_filename = format!("{}.pem", agent_id_and_version);
-        let public_key_type_filename = format!("{}.enc_type", agent_id_and_version);
-        let _ = save_file(&Path::new(&default_dir), &public_key_filename, public_key);
-        let _ = save_file(
-            &Path::new(&default_dir),
-            &public_key_type_filename,
-            public_key_enc_type,
-        );
+        let public_key_path = public_key_path(agent_id_and_version);
+        let public_key_type_path =
+            public_key_path.with_file_name(format!("{}.enc_type", agent_id_and_version));
+        let _ = save_to_filepath(&public_key_path, public_key);
+        let _ = save_to_filepath(&public_key_type_path, public_key_enc_type);
+        // drop any cached copy so the next load reads what was just saved
+        self.public_keys
+            .lock()
+            .expect("public_keys lock")
+            .remove(&public_key_path);
         Ok(())
     }
 
@@ -265,8 +271,9 @@ impl FileLoader for Agent {
         let documentoutput_filename = match output_filename {
             Some(filname) => {
                 // optional add jacs
-                let re = Regex::new(r"(\.[^.]+)$").unwrap();
-                let already_signed = Regex::new(r"\.jacs\.[^.]+$").unwrap();
+                let re = EXTENSION_REGEX.get_or_init(|| Regex::new(r"(\.[^.]+)$").unwrap());
+                let already_signed =
+                    SIGNED_EXTENSION_REGEX.get_or_init(|| Regex::new(r"\.jacs\.[^.]+$").unwrap());
                 let signed_filename = if already_signed.is_match(&filname) {
                     filname.to_string() // Do not modify if '.jacs' is already there
                 } else {
@@ -291,19 +298,24 @@ impl FileLoader for Agent {
         //     return Err("Executable files are not allowed.".into());
         // }
 
-        // Check if the file path is a local filesystem path
-        if !Path::new(&document_filepath).is_file() {
-            println!("document_filepath ? {}", document_filepath);
-            return Err("File not found, only local filesystem paths are supported.".into());
+        // Check the opened handle is a local file, so the file checked is the file read
+        let not_found_message = "File not found, only local filesystem paths are supported.";
+        let mut file = match File::open(&document_filepath) {
+            Ok(file) => file,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                error!("{} {}", not_found_message, document_filepath);
+                return Err(not_found_message.into());
+            }
+            Err(e) => return Err(e.into()),
+        };
+        if !file.metadata()?.is_file() {
+            error!("{} {}", not_found_message, document_filepath);
+            return Err(not_found_message.into());
         }
 
-        let mut contents = Vec::new();
-        let mut file = File::open(&document_filepath)?;
-        file.read_to_end(&mut contents)?;
-
-        // Compress the contents using gzip
+        // Stream the file through gzip so the uncompressed contents are never held in memory
         let mut gz_encoder = GzEncoder::new(Vec::new(), Compression::default());
-        gz_encoder.write_all(&contents)?;
+        std::io::copy(&mut file, &mut gz_encoder)?;
         let compressed_contents = gz_encoder.finish()?;
 
         // Encode the compressed contents using base64
@@ -376,11 +388,18 @@ fn load_private_key(file_path: &String, filename: &String) -> std::io::Result<Ve
     }
 }
 
+/// where another agent's public key is stored; also the key of the public key cache
+#[cfg(not(target_arch = "wasm32"))]
+fn public_key_path(agent_id_and_version: &String) -> PathBuf {
+    let default_dir = env::var("JACS_KEY_DIRECTORY").expect("JACS_KEY_DIRECTORY");
+    Path::new(&default_dir)
+        .join("public_keys")
+        .join(format!("{}.pem", agent_id_and_version))
+}
+
 #[cfg(not(target_arch = "wasm32"))]
 fn load_key_file(file_path: &String, filename: &String) -> std::io::Result<Vec<u8>> {
-    if let Some(parent) = Path::new(file_path).parent() {
-        fs::create_dir_all(parent)?;
-    }
+    // reading never needs the directory to be created; a missing key is just NotFound
     let full_path = Path::new(file_path).join(filename);
     return std::fs::read(full_path);
 }
@@ -393,13 +412,15 @@ fn save_file(file_path: &Path, filename: &String, content: &[u8]) -> std::io::Re
 
 #[cfg(not(target_arch = "wasm32"))]
 fn save_to_filepath(full_path: &PathBuf, content: &[u8]) -> std::io::Result<String> {
-    if full_path.exists() {
-        let backup_path = create_backup_path(&full_path)?;
-        warn!(
+    // copy straight away rather than checking exists() first; NotFound just means no backup
+    let backup_path = create_backup_path(&full_path)?;
+    match fs::copy(&full_path, &backup_path) {
+        Ok(_) => warn!(
             "path exists for {:?}, saving to {:?}",
             full_path, backup_path
-        );
-        fs::copy(&full_path, backup_path)?;
+        ),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+        Err(e) => return Err(e),
     }
 
     if let Some(parent) = full_path.parent() {
@@ -9,7 +9,7 @@ use crate::agent::document::{Document, JACSDocument};
 use crate::crypt::hash::hash_public_key;
 use std::fs;
 
-use crate::config::{get_default_dir, set_env_vars};
+use crate::config::{get_default_dir, set_env_vars_from_str};
 
 use crate::crypt::aes_encrypt::{decrypt_private_key, encrypt_private_key};
 
@@ -110,11 +110,15 @@ pub struct Agent {
     /// the resolver might ahve trouble TEST
     document_schemas: Arc<Mutex<HashMap<String, JSONSchema>>>,
     documents: Arc<Mutex<HashMap<String, JACSDocument>>>,
+    /// public keys of other agents already read from disk, by file path
+    public_keys: Arc<Mutex<HashMap<PathBuf, Vec<u8>>>>,
     default_directory: PathBuf,
     /// everything needed for the agent to sign things
     id: Option<String>,
     version: Option<String>,
     public_key: Option<Vec<u8>>,
+    /// hash of public_key, computed once when keys are set
+    public_key_hash: Option<String>,
     private_key: Option<SecretPrivateKey>,
     key_algorithm: Option<String>,
 }
@@ -137,14 +141,16 @@ impl Agent {
         headerversion: &String,
         signature_version: &String,
     ) -> Result<Self, Box<dyn Error>> {
-        set_env_vars();
+        // read the config once and use it for both the env vars and validation
+        let config = fs::read_to_string("jacs.config.json").expect("config file missing");
+        set_env_vars_from_str(Some(&config));
         let schema = Schema::new(agentversion, headerversion, signature_version)?;
         let document_schemas_map = Arc::new(Mutex::new(HashMap::new()));
         let document_map = Arc::new(Mutex::new(HashMap::new()));
+        let public_key_map = Arc::new(Mutex::new(HashMap::new()));
 
         let default_directory = get_default_dir();
 
-        let config = fs::read_to_string("jacs.config.json").expect("config file missing");
         schema.validate_config(&config).expect("config validation");
 
         Ok(Self {
@@ -152,11 +158,13 @@ impl Agent {
             value: None,
             document_schemas: document_schemas_map,
             documents: document_map,
+            public_keys: public_key_map,
             default_directory,
             id: None,
             version: None,
             key_algorithm: None,
             public_key: None,
+            public_key_hash: None,
             private_key: None,
         })
     }
@@ -187,6 +195,7 @@ impl Agent {
     ) -> Result<(), Box<dyn Error>> {
         let private_key_encrypted = encrypt_private_key(&private_key)?;
         self.private_key = Some(Secret::new(PrivateKey(private_key_encrypted))); //Some(private_key);
+        self.public_key_hash = Some(hash_public_key(&public_key));
         self.public_key = Some(public_key);
         //TODO check algo
         self.key_algorithm = Some(key_algorithm.to_string());
@@ -299,17 +308,18 @@ impl Agent {
         json_value: &Value,
         signature_key_from: &String,
     ) -> Result<String, Box<dyn Error>> {
-        let agentid = json_value[signature_key_from]["agentID"]
-            .as_str()
-            .unwrap_or("")
-            .trim_matches('"')
-            .to_string();
-        let agentversion = json_value[signature_key_from]["agentVersion"]
+        let signature_block = &json_value[signature_key_from];
+        let agentid = Agent::get_signature_field(signature_block, "agentID");
+        let agentversion = Agent::get_signature_field(signature_block, "agentVersion");
+        return Ok(format!("{}:{}", agentid, agentversion));
+    }
+
+    /// string value of a field in a signature block, "" if missing
+    fn get_signature_field<'a>(signature_block: &'a Value, field: &str) -> &'a str {
+        signature_block[field]
             .as_str()
             .unwrap_or("")
             .trim_matches('"')
-            .to_string();
-        return Ok(format!("{}:{}", agentid, agentversion));
     }
 
     pub fn signature_verification_procedure(
@@ -322,6 +332,13 @@ impl Agent {
         original_public_key_hash: Option<String>,
         signature: Option<String>,
     ) -> Result<(), Box<dyn Error>> {
+        // without a signature block there is nothing to check, so skip building the signed string
+        if signature.is_none() && json_value.get(signature_key_from).is_none() {
+            let error_message = format!("No signature found in field {}", signature_key_from);
+            error!("{}", error_message);
+            return Err(error_message.into());
+        }
+
         let (document_values_string, _) =
             Agent::get_values_as_string(&json_value, fields.cloned(), signature_key_from)?;
         debug!(
@@ -334,16 +351,13 @@ impl Agent {
             signature_key_from
         );
 
+        let signature_block = &json_value[signature_key_from];
         let public_key_hash: String = match original_public_key_hash {
             Some(orig) => orig,
-            _ => json_value[signature_key_from]["publicKeyHash"]
-                .as_str()
-                .unwrap_or("")
-                .trim_matches('"')
-                .to_string(),
+            _ => Agent::get_signature_field(signature_block, "publicKeyHash").to_string(),
         };
 
-        let public_key_rehash = hash_public_key(public_key.clone());
+        let public_key_rehash = hash_public_key(&public_key);
 
         if public_key_rehash != public_key_hash {
             let error_message = format!(
@@ -354,20 +368,12 @@ impl Agent {
             return Err(error_message.into());
         }
 
-        let signature_base64 = match signature.clone() {
-            Some(sig) => sig,
-            _ => json_value[signature_key_from]["signature"]
-                .as_str()
-                .unwrap_or("")
-                .trim_matches('"')
-                .to_string(),
+        let signature_base64 = match &signature {
+            Some(sig) => sig.clone(),
+            _ => Agent::get_signature_field(signature_block, "signature").to_string(),
         };
 
-        debug!("\n\n\n standard sig {}  \n agreement special sig \n{:?} \nchosen signature_base64\n {} \n\n\n", json_value[signature_key_from]["signature"]
-                .as_str()
-                .unwrap_or("")
-                .trim_matches('"')
-                .to_string(), signature , signature_base64);
+        debug!("\n\n\n standard sig {}  \n agreement special sig \n{:?} \nchosen signature_base64\n {} \n\n\n", Agent::get_signature_field(signature_block, "signature"), signature , signature_base64);
 
         self.verify_string(
             &document_values_string,
@@ -436,8 +442,7 @@ impl Agent {
             Ok(value) => value,
             Err(err) => return Err(Box::new(err)),
         };
-        let public_key = self.get_public_key()?;
-        let public_key_hash = hash_public_key(public_key);
+        let public_key_hash = self.get_public_key_hash()?;
         debug!("hash {:?} ", public_key_hash);
         //TODO fields must never include sha256 at top level
         // error
@@ -469,46 +474,56 @@ impl Agent {
     ) -> Result<(String, Vec<String>), Box<dyn Error>> {
         let mut result = String::new();
         debug!("get_values_as_string keys:\n{:?}", keys);
+        // appends one field's value to the signing string, rejecting reserved names
+        let mut append_value = |value: &Value| -> Result<(), Box<dyn Error>> {
+            if let Some(str_value) = value.as_str() {
+                if str_value == placement_key || JACS_IGNORE_FIELDS.contains(&str_value) {
+                    let error_message = format!(
+                        "Field names for signature must not include itself or hashing
+                              - these are reserved for this signature {}: see {:?}",
+                        placement_key, JACS_IGNORE_FIELDS
+                    );
+                    error!("{}", error_message);
+                    return Err(error_message.into());
+                }
+                result.push_str(str_value);
+                result.push_str(" ");
+            }
+            Ok(())
+        };
         let accepted_fields = match keys {
-            Some(keys) => keys,
+            Some(keys) => {
+                for key in &keys {
+                    if let Some(value) = json_value.get(key) {
+                        append_value(value)?;
+                    }
+                }
+                keys
+            }
             None => {
-                // Choose default field names
-                let default_keys: Vec<String> = json_value
-                    .as_object()
-                    .unwrap_or(&serde_json::Map::new())
-                    .keys()
-                    .filter(|&key| {
-                        key != placement_key && !JACS_IGNORE_FIELDS.contains(&key.as_str())
-                    })
-                    .map(|key| key.to_string())
-                    .collect();
+                // Choose default field names, reading each value in the same pass
+                let mut default_keys: Vec<String> = Vec::new();
+                if let Some(object) = json_value.as_object() {
+                    for (key, value) in object {
+                        if key != placement_key && !JACS_IGNORE_FIELDS.contains(&key.as_str()) {
+                            append_value(value)?;
+                            default_keys.push(key.to_string());
+                        }
+                    }
+                }
                 default_keys
             }
         };
 
-        for key in &accepted_fields {
-            if let Some(value) = json_value.get(&key) {
-                if let Some(str_value) = value.as_str() {
-                    if str_value == placement_key || JACS_IGNORE_FIELDS.contains(&str_value) {
-                        let error_message = format!(
-                            "Field names for signature must not include itself or hashing
-                              - these are reserved for this signature {}: see {:?}",
-                            placement_key, JACS_IGNORE_FIELDS
-                        );
-                        error!("{}", error_message);
-                        return Err(error_message.into());
-                    }
-                    result.push_str(str_value);
-                    result.push_str(" ");
-                }
-            }
-        }
+        // trim the buffer in place instead of copying it into a new String
+        result.truncate(result.trim_end().len());
+        let leading_whitespace = result.len() - result.trim_start().len();
+        result.drain(..leading_whitespace);
         debug!(
             "get_values_as_string result: {:?} fields {:?}",
-            result.trim().to_string(),
-            accepted_fields
+            result, accepted_fields
         );
-        Ok((result.trim().to_string(), accepted_fields))
+        Ok((result, accepted_fields))
     }
 
     /// verify the hash of a complete document that has SHA256_FIELDNAME
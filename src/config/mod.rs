@@ -83,9 +83,15 @@ pub fn split_id(input: &str) -> Option<(&str, &str)> {
 }
 
 pub fn set_env_vars() -> String {
-    let config: Config = match fs::read_to_string("jacs.config.json") {
-        Ok(content) => serde_json::from_str(&content).unwrap_or_default(),
-        Err(_) => Config {
+    let config_string = fs::read_to_string("jacs.config.json").ok();
+    set_env_vars_from_str(config_string.as_deref())
+}
+
+/// same as set_env_vars, for callers that have already read jacs.config.json
+pub fn set_env_vars_from_str(config_string: Option<&str>) -> String {
+    let config: Config = match config_string {
+        Some(content) => serde_json::from_str(content).unwrap_or_default(),
+        None => Config {
             schema: "https://hai.ai/schemas/jacs.config.schema.json".to_string(),
             jacs_use_filesystem: None,
             jacs_use_security: None,
@@ -8,11 +8,13 @@ pub fn hash_string(input_string: &String) -> String {
     return hashed_string;
 }
 
-pub fn hash_public_key(public_key_bytes: Vec<u8>) -> String {
+/// takes anything that can lend its bytes, so callers don't need to clone a key just to hash it
+pub fn hash_public_key(public_key_bytes: impl AsRef<[u8]>) -> String {
+    let public_key_bytes = public_key_bytes.as_ref();
     let (encoding, _) =
-        encoding_rs::Encoding::for_bom(&public_key_bytes).unwrap_or((encoding_rs::UTF_8, 0));
-    let public_key_string = encoding.decode(&public_key_bytes).0.into_owned();
+        encoding_rs::Encoding::for_bom(public_key_bytes).unwrap_or((encoding_rs::UTF_8, 0));
+    let public_key_string = encoding.decode(public_key_bytes).0;
     // see test ... cargo test   --test key_tests -- --nocapture
     let normalized = public_key_string.trim().replace("\r", "");
-    return hash_string(&normalized.to_string());
+    return hash_string(&normalized);
 }
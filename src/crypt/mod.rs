@@ -42,6 +42,12 @@ pub trait KeyManager {
     ) -> Result<(), Box<dyn std::error::Error>>;
 }
 
+/// decrypts the agent's private key, handing the buffer over without another copy
+fn decrypted_private_key(agent: &Agent) -> Result<Vec<u8>, Box<dyn std::error::Error>> {
+    let binding = agent.get_private_key()?;
+    Ok(binding.expose_secret().use_secret())
+}
+
 impl KeyManager for Agent {
     /// this necessatates updateding the version of the agent
     fn generate_keys(&mut self) -> Result<(), Box<dyn std::error::Error>> {
@@ -79,23 +85,13 @@ impl KeyManager for Agent {
         let algo = CryptoSigningAlgorithm::from_str(&key_algorithm).unwrap();
         match algo {
             CryptoSigningAlgorithm::RsaPss => {
-                let binding = self.get_private_key()?;
-                let borrowed_key = binding.expose_secret();
-                let key_vec = borrowed_key.use_secret();
-
-                return rsawrapper::sign_string(key_vec.to_vec(), data);
+                return rsawrapper::sign_string(decrypted_private_key(self)?, data);
             }
             CryptoSigningAlgorithm::RingEd25519 => {
-                let binding = self.get_private_key()?;
-                let borrowed_key = binding.expose_secret();
-                let key_vec = borrowed_key.use_secret();
-                return ringwrapper::sign_string(key_vec.to_vec(), data);
+                return ringwrapper::sign_string(decrypted_private_key(self)?, data);
             }
             CryptoSigningAlgorithm::PqDilithium => {
-                let binding = self.get_private_key()?;
-                let borrowed_key = binding.expose_secret();
-                let key_vec = borrowed_key.use_secret();
-                return pq::sign_string(key_vec.to_vec(), data);
+                return pq::sign_string(decrypted_private_key(self)?, data);
             }
             _ => {
                 return Err(
@@ -560,23 +560,18 @@ impl Schema {
             }
         };
 
-        let validation_result = self.jacsconfigschema.validate(&instance);
-
-        match validation_result {
-            Ok(_) => Ok(instance.clone()),
-            Err(errors) => {
-                error!("error validating config file");
-                let error_messages: Vec<String> =
-                    errors.into_iter().map(|e| e.to_string()).collect();
-                Err(error_messages
-                    .first()
-                    .cloned()
-                    .unwrap_or_else(|| {
-                        "Unexpected error during validation: no error messages found".to_string()
-                    })
-                    .into())
-            }
+        if let Err(errors) = self.jacsconfigschema.validate(&instance) {
+            error!("error validating config file");
+            let error_messages: Vec<String> = errors.into_iter().map(|e| e.to_string()).collect();
+            return Err(error_messages
+                .first()
+                .cloned()
+                .unwrap_or_else(|| {
+                    "Unexpected error during validation: no error messages found".to_string()
+                })
+                .into());
         }
+        Ok(instance)
     }
 
     /// basic check this conforms to a schema
@@ -585,35 +580,42 @@ impl Schema {
         &self,
         json: &str,
     ) -> Result<Value, Box<dyn std::error::Error + 'static>> {
-        let instance: serde_json::Value = match serde_json::from_str(json) {
+        let instance = Schema::parse_json(json)?;
+        self.validate_header_value(instance)
+    }
+
+    /// parse a document before validation, with the error message validation reports
+    pub fn parse_json(json: &str) -> Result<Value, Box<dyn std::error::Error + 'static>> {
+        match serde_json::from_str(json) {
             Ok(value) => {
                 debug!("validate json {:?}", value);
-                value
+                Ok(value)
             }
             Err(e) => {
                 let error_message = format!("Invalid JSON: {}", e);
                 warn!("validate error {:?}", error_message);
-                return Err(error_message.into());
+                Err(error_message.into())
             }
-        };
-
-        let validation_result = self.headerschema.validate(&instance);
+        }
+    }
 
-        match validation_result {
-            Ok(_) => Ok(instance.clone()),
-            Err(errors) => {
-                error!("error validating header schema");
-                let error_messages: Vec<String> =
-                    errors.into_iter().map(|e| e.to_string()).collect();
-                Err(error_messages
-                    .first()
-                    .cloned()
-                    .unwrap_or_else(|| {
-                        "Unexpected error during validation: no error messages found".to_string()
-                    })
-                    .into())
-            }
+    /// same as validate_header, for callers that already hold a parsed Value
+    pub fn validate_header_value(
+        &self,
+        instance: Value,
+    ) -> Result<Value, Box<dyn std::error::Error + 'static>> {
+        if let Err(errors) = self.headerschema.validate(&instance) {
+            error!("error validating header schema");
+            let error_messages: Vec<String> = errors.into_iter().map(|e| e.to_string()).collect();
+            return Err(error_messages
+                .first()
+                .cloned()
+                .unwrap_or_else(|| {
+                    "Unexpected error during validation: no error messages found".to_string()
+                })
+                .into());
         }
+        Ok(instance)
     }
 
     /// basic check this conforms to a schema
@@ -631,23 +633,18 @@ impl Schema {
             }
         };
 
-        let validation_result = self.taskschema.validate(&instance);
-
-        match validation_result {
-            Ok(_) => Ok(instance.clone()),
-            Err(errors) => {
-                error!("error validating task schema");
-                let error_messages: Vec<String> =
-                    errors.into_iter().map(|e| e.to_string()).collect();
-                Err(error_messages
-                    .first()
-                    .cloned()
-                    .unwrap_or_else(|| {
-                        "Unexpected error during validation: no error messages found".to_string()
-                    })
-                    .into())
-            }
+        if let Err(errors) = self.taskschema.validate(&instance) {
+            error!("error validating task schema");
+            let error_messages: Vec<String> = errors.into_iter().map(|e| e.to_string()).collect();
+            return Err(error_messages
+                .first()
+                .cloned()
+                .unwrap_or_else(|| {
+                    "Unexpected error during validation: no error messages found".to_string()
+                })
+                .into());
         }
+        Ok(instance)
     }
 
     /// basic check this conforms to a schema
@@ -691,23 +688,18 @@ impl Schema {
             }
         };
 
-        let validation_result = self.agentschema.validate(&instance);
-
-        match validation_result {
-            Ok(_) => Ok(instance.clone()),
-            Err(errors) => {
-                error!("error validating agent schema");
-                let error_messages: Vec<String> =
-                    errors.into_iter().map(|e| e.to_string()).collect();
-                Err(error_messages
-                    .first()
-                    .cloned()
-                    .unwrap_or_else(|| {
-                        "Unexpected error during validation: no error messages found".to_string()
-                    })
-                    .into())
-            }
+        if let Err(errors) = self.agentschema.validate(&instance) {
+            error!("error validating agent schema");
+            let error_messages: Vec<String> = errors.into_iter().map(|e| e.to_string()).collect();
+            return Err(error_messages
+                .first()
+                .cloned()
+                .unwrap_or_else(|| {
+                    "Unexpected error during validation: no error messages found".to_string()
+                })
+                .into());
         }
+        Ok(instance)
     }
 
     // TODO get from member var  self.headerschema.to_string())
@@ -761,23 +753,18 @@ impl Schema {
             instance["$schema"] = json!(format!("{}", self.get_header_schema_url()));
         }
 
-        let validation_result = self.headerschema.validate(&instance);
-
-        match validation_result {
-            Ok(instance) => instance,
-            Err(errors) => {
-                let error_messages: Vec<String> =
-                    errors.into_iter().map(|e| e.to_string()).collect();
-                let error_message = error_messages.first().cloned().unwrap_or_else(|| {
-                    "Unexpected error during validation: no error messages found".to_string()
-                });
-                error!("{}", error_message);
-                return Err(Box::new(ValidationError(error_message))
-                    as Box<dyn std::error::Error + 'static>);
-            }
-        };
+        if let Err(errors) = self.headerschema.validate(&instance) {
+            let error_messages: Vec<String> = errors.into_iter().map(|e| e.to_string()).collect();
+            let error_message = error_messages.first().cloned().unwrap_or_else(|| {
+                "Unexpected error during validation: no error messages found".to_string()
+            });
+            error!("{}", error_message);
+            return Err(
+                Box::new(ValidationError(error_message)) as Box<dyn std::error::Error + 'static>
+            );
+        }
 
-        Ok(instance.clone())
+        Ok(instance)
     }
 
     // pub fn create_document(&self, json: &str) -> Result<Value, String> {
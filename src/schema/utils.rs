@@ -2,14 +2,14 @@ use crate::schema::Url;
 use log::debug;
 use log::error;
 use log::info;
-use std::path::Path;
 
 use phf::phf_map;
 
 use jsonschema::SchemaResolver;
 use jsonschema::SchemaResolverError;
 use serde_json::Value;
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex, OnceLock};
 
 use std::error::Error;
 use std::fmt;
@@ -88,6 +88,42 @@ impl SchemaResolver for EmbeddedSchemaResolver {
     }
 }
 
+/// shared client for remote schema retrieval so connections are pooled across lookups
+static SCHEMA_HTTP_CLIENT: OnceLock<reqwest::blocking::Client> = OnceLock::new();
+
+fn schema_http_client() -> Result<&'static reqwest::blocking::Client, reqwest::Error> {
+    if let Some(client) = SCHEMA_HTTP_CLIENT.get() {
+        return Ok(client);
+    }
+    // Create a reqwest client with SSL verification disabled
+    let client = reqwest::blocking::Client::builder()
+        .danger_accept_invalid_certs(ACCEPT_INVALID_CERTS)
+        .build()?;
+    Ok(SCHEMA_HTTP_CLIENT.get_or_init(|| client))
+}
+
+/// parsed copies of DEFAULT_SCHEMA_STRINGS, filled the first time each one is resolved
+static EMBEDDED_SCHEMA_CACHE: OnceLock<Mutex<HashMap<&'static str, Arc<Value>>>> = OnceLock::new();
+
+/// returns None if the path is not an embedded schema
+fn get_embedded_schema(path: &str) -> Option<Result<Arc<Value>, serde_json::Error>> {
+    let (&schema_path, &schema_json) = DEFAULT_SCHEMA_STRINGS.get_entry(path)?;
+    let mut cache = EMBEDDED_SCHEMA_CACHE
+        .get_or_init(|| Mutex::new(HashMap::new()))
+        .lock()
+        .expect("embedded schema cache lock");
+    if let Some(schema_value) = cache.get(schema_path) {
+        return Some(Ok(Arc::clone(schema_value)));
+    }
+    let schema_value: Value = match serde_json::from_str(schema_json) {
+        Ok(schema_value) => schema_value,
+        Err(e) => return Some(Err(e)),
+    };
+    let schema_value = Arc::new(schema_value);
+    cache.insert(schema_path, Arc::clone(&schema_value));
+    Some(Ok(schema_value))
+}
+
 // todo handle case for url retrieval
 pub fn resolve_schema(rawpath: &str) -> Result<Arc<Value>, SchemaResolverError> {
     debug!("Entering resolve_schema function with path: {}", rawpath);
@@ -102,40 +138,30 @@ pub fn resolve_schema(rawpath: &str) -> Result<Arc<Value>, SchemaResolverError>
     };
 
     // in case the path is cached
-    let schema_json_result = DEFAULT_SCHEMA_STRINGS.get(path);
-    match schema_json_result {
-        Some(schema_json) => {
-            schema_value = serde_json::from_str(schema_json)?;
-            return Ok(Arc::new(schema_value));
-        }
-        _ => {}
+    if let Some(schema_value) = get_embedded_schema(path) {
+        return Ok(schema_value?);
     }
 
     if path.starts_with("http://") || path.starts_with("https://") {
         debug!("Attempting to fetch schema from URL: {}", path);
         if path.starts_with("https://hai.ai") {
             let relative_path = path.trim_start_matches("https://hai.ai/");
-            let schema_json = DEFAULT_SCHEMA_STRINGS.get(relative_path).ok_or_else(|| {
+            let schema_value = get_embedded_schema(relative_path).ok_or_else(|| {
                 error!("Error: Schema not found for URL: {}", path);
                 SchemaResolverError::new(SchemaResolverErrorWrapper(format!(
                     "Schema not found: {}",
                     path
                 )))
             })?;
-            schema_value = serde_json::from_str(&schema_json)?;
-            return Ok(Arc::new(schema_value));
+            return Ok(schema_value?);
         } else {
-            // Create a reqwest client with SSL verification disabled
-            let client = reqwest::blocking::Client::builder()
-                .danger_accept_invalid_certs(ACCEPT_INVALID_CERTS)
-                .build()
-                .map_err(|err| {
-                    error!("Error fetching schema from URL: {}, error: {}", path, err);
-                    SchemaResolverError::new(SchemaResolverErrorWrapper(format!(
-                        "Failed to create reqwest client: {}",
-                        err
-                    )))
-                })?;
+            let client = schema_http_client().map_err(|err| {
+                error!("Error fetching schema from URL: {}, error: {}", path, err);
+                SchemaResolverError::new(SchemaResolverErrorWrapper(format!(
+                    "Failed to create reqwest client: {}",
+                    err
+                )))
+            })?;
 
             // Fetch the schema using the reqwest client
             let schema_response = client.get(path).send().map_err(|err| {
@@ -161,16 +187,21 @@ pub fn resolve_schema(rawpath: &str) -> Result<Arc<Value>, SchemaResolverError>
                 )))
             }
         }
-    } else if Path::new(path).exists() {
+    } else {
         // add default directory
         // todo secure with let pathstring: &String = &env::var("JACS_KEY_DIRECTORY").expect("JACS_DATA_DIRECTORY");
+        // read directly instead of checking exists() first, so a missing file is a single syscall
+        let schema_json = match std::fs::read_to_string(path) {
+            Ok(schema_json) => schema_json,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                return Err(SchemaResolverError::new(SchemaResolverErrorWrapper(
+                    format!("Failed all attempts to retrieve schema {} ", path,),
+                )));
+            }
+            Err(e) => return Err(e.into()),
+        };
         println!("loading custom local schema {}", path);
-        let schema_json = std::fs::read_to_string(path)?;
         let schema_value: Value = serde_json::from_str(&schema_json)?;
         return Ok(Arc::new(schema_value));
-    } else {
-        return Err(SchemaResolverError::new(SchemaResolverErrorWrapper(
-            format!("Failed all attempts to retrieve schema {} ", path,),
-        )));
     }
 }
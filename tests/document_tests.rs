@@ -9,6 +9,7 @@ use utils::DOCTESTFILE;
 use utils::{load_local_document, load_test_agent_one, load_test_agent_two};
 // use color_eyre::eyre::Result;
 use jacs::agent::DOCUMENT_AGENT_SIGNATURE_FIELDNAME;
+use jacs::agent::SHA256_FIELDNAME;
 extern crate env_logger;
 use log::{error, info};
 
@@ -322,3 +323,35 @@ fn test_load_custom_schema_and_custom_document_and_update_and_verify_signature()
         Err(e) => panic!("Error in test_load_custom_schema_and_custom_document_and_update_and_verify_signature verifying document signature: {}", e),
     };
 }
+
+#[test]
+fn test_update_document_value_matches_update_document() {
+    // cargo test   --test document_tests -- --nocapture test_update_document_value_matches_update_document
+    let mut agent = load_test_agent_one();
+    let document_string = load_local_document(&DOCTESTFILE.to_string()).unwrap();
+    let document = agent.load_document(&document_string).unwrap();
+    let document_key = document.getkey();
+    let modified_document_string = load_local_document(&TESTFILE_MODIFIED.to_string()).unwrap();
+    let modified_document: serde_json::Value =
+        serde_json::from_str(&modified_document_string).unwrap();
+
+    let from_string = agent
+        .update_document(&document_key, &modified_document_string, None, None)
+        .unwrap();
+    let from_value = agent
+        .update_document_value(&document_key, modified_document, None, None)
+        .unwrap();
+
+    for updated in [&from_string, &from_value] {
+        assert_eq!(
+            updated.value["jacsLastVersion"],
+            document.value["jacsVersion"]
+        );
+        assert_ne!(updated.version, document.version);
+        assert_ne!(
+            updated.value[SHA256_FIELDNAME],
+            document.value[SHA256_FIELDNAME]
+        );
+        assert!(agent.verify_hash(&updated.value).unwrap());
+    }
+}
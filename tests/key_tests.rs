@@ -122,3 +122,37 @@ hCmTebk/ToIKWZ+YeOMbi38CAwEAAQ==
     // let public_key_string_lossy_nnl = String::from_utf8_lossy(public_key_no_newline).to_string();
     // let public_key_rehash3_nnl = jacs_hash_string(&public_key_no_newline);
 }
+
+#[test]
+fn test_saved_remote_public_key_replaces_cached_key() {
+    // cargo test   --test key_tests -- --nocapture test_saved_remote_public_key_replaces_cached_key
+    let agent = load_test_agent_one();
+    let agent_id_and_version = "public-key-cache-test:1".to_string();
+    let first_key = b"first public key".to_vec();
+    let second_key = b"second public key".to_vec();
+
+    agent
+        .fs_save_remote_public_key(&agent_id_and_version, &first_key, b"RSA-PSS")
+        .unwrap();
+    assert_eq!(
+        agent.fs_load_public_key(&agent_id_and_version).unwrap(),
+        first_key
+    );
+
+    agent
+        .fs_save_remote_public_key(&agent_id_and_version, &second_key, b"RSA-PSS")
+        .unwrap();
+    let reloaded_key = agent.fs_load_public_key(&agent_id_and_version).unwrap();
+
+    // remove the key, its enc_type and any backups before asserting
+    let key_directory = std::env::var("JACS_KEY_DIRECTORY").unwrap();
+    let public_keys_directory = std::path::Path::new(&key_directory).join("public_keys");
+    for entry in std::fs::read_dir(public_keys_directory).unwrap() {
+        let path = entry.unwrap().path();
+        if path.to_string_lossy().contains(&agent_id_and_version) {
+            std::fs::remove_file(path).unwrap();
+        }
+    }
+
+    assert_eq!(reloaded_key, second_key);
+}